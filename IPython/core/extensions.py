@@ -147,13 +147,15 @@ def reload_extension(self, module_str: str):
             self.load_extension(module_str)
 
     def _call_load_ipython_extension(self, mod):
-        if hasattr(mod, 'load_ipython_extension'):
-            mod.load_ipython_extension(self.shell)
+        load = getattr(mod, "load_ipython_extension", None)
+        if load is not None:
+            load(self.shell)
             return True
 
     def _call_unload_ipython_extension(self, mod):
-        if hasattr(mod, 'unload_ipython_extension'):
-            mod.unload_ipython_extension(self.shell)
+        unload = getattr(mod, "unload_ipython_extension", None)
+        if unload is not None:
+            unload(self.shell)
             return True
 
     @undoc
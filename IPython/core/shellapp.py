@@ -65,10 +65,9 @@
         "Exclude the current working directory from sys.path",
         "Include the current working directory in sys.path",
 )
-nosep_config = Config()
-nosep_config.InteractiveShell.separate_in = ''
-nosep_config.InteractiveShell.separate_out = ''
-nosep_config.InteractiveShell.separate_out2 = ''
+nosep_config = Config(
+    InteractiveShell=dict(separate_in="", separate_out="", separate_out2="")
+)
 
 shell_flags['nosep']=(nosep_config, "Eliminate all spacing between prompts.")
 shell_flags['pylab'] = (
@@ -277,19 +276,20 @@ def init_extensions(self):
                 self.default_extensions + self.extensions + self.extra_extensions
             )
             for ext in extensions:
+                self.log.info("Loading IPython extension: %s", ext)
                 try:
-                    self.log.info("Loading IPython extension: %s" % ext)
                     self.shell.extension_manager.load_extension(ext)
-                except:
+                except Exception:
                     if self.reraise_ipython_extension_failures:
                         raise
-                    msg = ("Error in loading extension: {ext}\n"
-                           "Check your config files in {location}".format(
-                               ext=ext,
-                               location=self.profile_dir.location
-                           ))
-                    self.log.warning(msg, exc_info=True)
-        except:
+                    self.log.warning(
+                        "Error in loading extension: %s\n"
+                        "Check your config files in %s",
+                        ext,
+                        self.profile_dir.location,
+                        exc_info=True,
+                    )
+        except Exception:
             if self.reraise_ipython_extension_failures:
                 raise
             self.log.warning("Unknown error in loading extensions:", exc_info=True)
@@ -321,15 +321,15 @@ def _run_exec_lines(self):
         try:
             self.log.debug("Running code from IPythonApp.exec_lines...")
             for line in self.exec_lines:
+                self.log.info("Running code in user namespace: %s", line)
                 try:
-                    self.log.info("Running code in user namespace: %s" %
-                                  line)
                     self.shell.run_cell(line, store_history=False)
-                except:
-                    self.log.warning("Error in executing line in user "
-                                  "namespace: %s" % line)
+                except Exception:
+                    self.log.warning(
+                        "Error in executing line in user namespace: %s", line
+                    )
                     self.shell.showtraceback()
-        except:
+        except Exception:
             self.log.warning("Unknown error in handling IPythonApp.exec_lines:")
             self.shell.showtraceback()
 
@@ -337,29 +337,32 @@ def _exec_file(self, fname, shell_futures=False):
         try:
             full_filename = filefind(fname, [u'.', self.ipython_dir])
         except IOError:
-            self.log.warning("File not found: %r"%fname)
+            self.log.warning("File not found: %r", fname)
             return
         # Make sure that the running script gets a proper sys.argv as if it
         # were run from a system shell.
         save_argv = sys.argv
         sys.argv = [full_filename] + self.extra_args[1:]
         try:
-            if os.path.isfile(full_filename):
-                self.log.info("Running file in user namespace: %s" %
-                              full_filename)
-                # Ensure that __file__ is always defined to match Python
-                # behavior.
-                with preserve_keys(self.shell.user_ns, '__file__'):
-                    self.shell.user_ns['__file__'] = fname
-                    if full_filename.endswith('.ipy') or full_filename.endswith('.ipynb'):
-                        self.shell.safe_execfile_ipy(full_filename,
-                                                     shell_futures=shell_futures)
-                    else:
-                        # default to python, even without extension
-                        self.shell.safe_execfile(full_filename,
-                                                 self.shell.user_ns,
-                                                 shell_futures=shell_futures,
-                                                 raise_exceptions=True)
+            # filefind only returns paths that passed os.path.isfile, so
+            # there is no need to stat the file again here.
+            self.log.info("Running file in user namespace: %s", full_filename)
+            # Ensure that __file__ is always defined to match Python
+            # behavior.
+            with preserve_keys(self.shell.user_ns, "__file__"):
+                self.shell.user_ns["__file__"] = fname
+                if full_filename.endswith((".ipy", ".ipynb")):
+                    self.shell.safe_execfile_ipy(
+                        full_filename, shell_futures=shell_futures
+                    )
+                else:
+                    # default to python, even without extension
+                    self.shell.safe_execfile(
+                        full_filename,
+                        self.shell.user_ns,
+                        shell_futures=shell_futures,
+                        raise_exceptions=True,
+                    )
         finally:
             sys.argv = save_argv
 
@@ -402,7 +405,7 @@ def _run_exec_files(self):
         try:
             for fname in self.exec_files:
                 self._exec_file(fname)
-        except:
+        except Exception:
             self.log.warning("Unknown error in handling IPythonApp.exec_files:")
             self.shell.showtraceback()
 
@@ -411,12 +414,10 @@ def _run_cmd_line_code(self):
         if self.code_to_run:
             line = self.code_to_run
             try:
-                self.log.info("Running code given at command line (c=): %s" %
-                              line)
+                self.log.info("Running code given at command line (c=): %s", line)
                 self.shell.run_cell(line, store_history=False)
             except:
-                self.log.warning("Error in executing line in user namespace: %s" %
-                              line)
+                self.log.warning("Error in executing line in user namespace: %s", line)
                 self.shell.showtraceback()
                 if not self.interact:
                     self.exit(1)
@@ -16,7 +16,11 @@
 # Imports
 #-----------------------------------------------------------------------------
 import unittest
+from unittest import mock
 
+from traitlets.config.configurable import LoggingConfigurable
+
+from IPython.core.shellapp import InteractiveShellApp
 from IPython.testing import decorators as dec
 from IPython.testing import tools as tt
 
@@ -54,3 +58,27 @@ def test_py_script_file_attribute_interactively(self):
             commands=['"__file__" in globals()', "print(123)", "exit()"],
         )
         assert "False" in out, f"Subprocess stderr:\n{err}\n-----"
+
+
+class _ShellApp(InteractiveShellApp, LoggingConfigurable):
+    """InteractiveShellApp with the logger normally provided by the Application."""
+
+
+class TestExecLines(unittest.TestCase):
+    """Test error handling when running IPythonApp.exec_lines."""
+
+    def setUp(self):
+        self.ip = get_ipython()
+        self.app = _ShellApp(shell=self.ip, exec_lines=["pass"])
+
+    def test_exception_is_logged(self):
+        with mock.patch.object(self.ip, "run_cell", side_effect=ValueError):
+            with mock.patch.object(self.ip, "showtraceback"):
+                with self.assertLogs(self.app.log, level="WARNING") as cm:
+                    self.app._run_exec_lines()
+        assert "Error in executing line in user namespace: pass" in cm.output[0]
+
+    def test_keyboard_interrupt_propagates(self):
+        with mock.patch.object(self.ip, "run_cell", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.app._run_exec_lines()
@@ -13,6 +13,8 @@
 import os
 import sys
 import warnings
+from copy import deepcopy
+from functools import lru_cache
 
 from traitlets.config.loader import Config
 from traitlets.config.application import boolean_flag, catch_config_error
@@ -121,15 +123,20 @@ def make_report(self,traceback):
     "Enable auto setting the terminal title.",
     "Disable auto setting the terminal title."
 )
-classic_config = Config()
-classic_config.InteractiveShell.cache_size = 0
-classic_config.PlainTextFormatter.pprint = False
-classic_config.TerminalInteractiveShell.prompts_class='IPython.terminal.prompts.ClassicPrompts'
-classic_config.InteractiveShell.separate_in = ''
-classic_config.InteractiveShell.separate_out = ''
-classic_config.InteractiveShell.separate_out2 = ''
-classic_config.InteractiveShell.colors = 'NoColor'
-classic_config.InteractiveShell.xmode = 'Plain'
+classic_config = Config(
+    InteractiveShell=dict(
+        cache_size=0,
+        separate_in="",
+        separate_out="",
+        separate_out2="",
+        colors="NoColor",
+        xmode="Plain",
+    ),
+    PlainTextFormatter=dict(pprint=False),
+    TerminalInteractiveShell=dict(
+        prompts_class="IPython.terminal.prompts.ClassicPrompts"
+    ),
+)
 
 frontend_flags['classic']=(
     classic_config,
@@ -321,19 +328,51 @@ def start(self):
             if not self.shell.last_execution_succeeded:
                 sys.exit(1)
 
+
+def _config_file_stats(profile_dir):
+    """Return a tuple of ``(mtime_ns, size)`` for each config file in `profile_dir`.
+
+    Entries for config files that don't exist are None.
+    """
+    stats = []
+    for ext in (".py", ".json"):
+        fname = os.path.join(profile_dir, "ipython_config" + ext)
+        try:
+            st = os.stat(fname)
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((st.st_mtime_ns, st.st_size))
+    return tuple(stats)
+
+
+# `stats` is unused in the body; it's only there as part of the lru_cache key.
+@lru_cache(maxsize=8)
+def _load_default_config(profile_dir, stats):
+    app = TerminalIPythonApp()
+    app.config_file_paths.append(profile_dir)
+    app.load_config_file()
+    return app.config
+
+
 def load_default_config(ipython_dir=None):
     """Load the default config file from the default ipython_dir.
 
     This is useful for embedded shells.
+
+    The loaded config is cached per profile directory, and is only reloaded
+    when the modification time or size of ``ipython_config.py`` or
+    ``ipython_config.json`` in that directory changes. Files pulled in with
+    ``load_subconfig``, and config code that depends on environment variables
+    or the current working directory, are not tracked. Each call returns a
+    fresh copy, which the caller is free to modify.
     """
     if ipython_dir is None:
         ipython_dir = get_ipython_dir()
 
     profile_dir = os.path.join(ipython_dir, 'profile_default')
-    app = TerminalIPythonApp()
-    app.config_file_paths.append(profile_dir)
-    app.load_config_file()
-    return app.config
+    config = _load_default_config(profile_dir, _config_file_stats(profile_dir))
+    return deepcopy(config)
 
 launch_new_instance = TerminalIPythonApp.launch_instance
 
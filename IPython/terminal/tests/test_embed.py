@@ -14,6 +14,7 @@
 import os
 import subprocess
 import sys
+from tempfile import TemporaryDirectory
 
 from IPython.utils.tempdir import NamedFileInTemporaryDirectory
 from IPython.testing.decorators import skip_win32
@@ -136,3 +137,28 @@ def test_nest_embed():
     child.expect(ipy_prompt)
     child.sendline('exit')
     child.close()
+
+
+def test_load_default_config_cached():
+    from IPython.terminal.ipapp import load_default_config
+
+    with TemporaryDirectory() as ipdir:
+        profile_dir = os.path.join(ipdir, "profile_default")
+        os.mkdir(profile_dir)
+        config_file = os.path.join(profile_dir, "ipython_config.py")
+        with open(config_file, "w", encoding="utf-8") as f:
+            f.write("c.InteractiveShell.colors = 'LightBG'\n")
+
+        config = load_default_config(ipdir)
+        assert config.InteractiveShell.colors == "LightBG"
+        # callers get their own copy
+        config.InteractiveShell.colors = "NoColor"
+        assert load_default_config(ipdir).InteractiveShell.colors == "LightBG"
+
+        # editing the config file invalidates the cache, even if the rewrite
+        # lands within the filesystem's timestamp granularity
+        mtime = os.stat(config_file).st_mtime_ns
+        with open(config_file, "w", encoding="utf-8") as f:
+            f.write("c.InteractiveShell.colors = 'Linux'\n")
+        os.utime(config_file, ns=(mtime, mtime))
+        assert load_default_config(ipdir).InteractiveShell.colors == "Linux"